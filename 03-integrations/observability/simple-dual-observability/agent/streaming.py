@@ -0,0 +1,52 @@
+"""Client-side parsing of the agent's streamed invoke_agent_runtime responses."""
+
+import json
+from typing import Any
+
+# The agent streams its reply as server-sent events
+SSE_DATA_PREFIX: bytes = b"data: "
+
+
+def read_agent_response(response: dict[str, Any]) -> str:
+    """
+    Read the agent's reply from an invoke_agent_runtime response.
+
+    The agent streams its reply as server-sent events, where each data line
+    carries one JSON-encoded text chunk. A failure after the stream has started
+    arrives as a JSON object event with an "error" key. Non-streaming bodies
+    are returned as-is.
+
+    Args:
+        response: invoke_agent_runtime response
+
+    Returns:
+        Agent response text
+
+    Raises:
+        RuntimeError: If the agent reports an error in the event stream
+    """
+    response_body = response.get("response")
+    if response_body is None:
+        return ""
+
+    if isinstance(response_body, str):
+        return response_body
+
+    if "text/event-stream" in response.get("contentType", ""):
+        chunks = []
+        for line in response_body.iter_lines():
+            if not line.startswith(SSE_DATA_PREFIX):
+                continue
+            event = json.loads(line[len(SSE_DATA_PREFIX) :])
+            if isinstance(event, dict) and "error" in event:
+                raise RuntimeError(
+                    f"Agent failed while streaming ({event.get('error_type', 'Error')}): "
+                    f"{event['error']}"
+                )
+            chunks.append(event if isinstance(event, str) else json.dumps(event))
+        return "".join(chunks)
+
+    raw_data = response_body.read()
+    if isinstance(raw_data, bytes):
+        return raw_data.decode("utf-8")
+    return str(raw_data)
@@ -10,13 +10,47 @@ When Braintrust observability is enabled (via BRAINTRUST_API_KEY env var),
 the agent initializes Strands telemetry to export traces to Braintrust.
 """
 
+import ast
+import functools
+import hashlib
+import json
 import logging
+import operator
 import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future
+from enum import StrEnum
 from typing import Any
 
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from strands import Agent, tool
+from strands.agent import AgentResult
+from strands.agent.conversation_manager import SlidingWindowConversationManager
 from strands.models import BedrockModel
+from strands.tools.executors import ConcurrentToolExecutor
+from strands.types.exceptions import ModelThrottledException
+
+from tools.calculator_tool import calculator as calc_impl
+from tools.time_tool import get_time as time_impl
+from tools.weather_tool import get_weather as weather_impl
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +65,227 @@ logger = logging.getLogger(__name__)
 app = BedrockAgentCoreApp()
 
 
+class ToolCacheMode(StrEnum):
+    """How tool calls interact with the tool result cache."""
+
+    # Serve hits from the cache, call the real tool on a miss
+    ONLINE = "online"
+    # Serve only cached results and raise on a miss (deterministic evals)
+    ISOLATED = "isolated"
+    # Always call the real tool
+    DISABLED = "disabled"
+
+
+# Seconds a cached tool result stays valid. get_time reports the time to the
+# second, so its results are only shared by calls within the same second
+# (e.g. parallel tool uses in one model turn).
+TOOL_CACHE_TTL_SECONDS: dict[str, float] = {
+    "get_weather": 300.0,
+    "get_time": 1.0,
+    "calculator": 3600.0,
+}
+TOOL_CACHE_DEFAULT_TTL_SECONDS: float = 60.0
+TOOL_CACHE_MAX_ENTRIES: int = 1024
+
+
+class ToolResultCache:
+    """
+    Content-addressable LRU cache with per-tool TTLs for tool results.
+
+    Entries are keyed by a hash of the tool name and its canonical JSON input,
+    so repeated calls with identical arguments skip the tool entirely.
+    Identical calls that arrive while the first is still running (duplicate
+    toolUse blocks in one turn, run by the concurrent tool executor) wait for
+    and share that single execution. Exceptions raised by a tool are never
+    cached.
+    """
+
+    def __init__(
+        self,
+        mode: ToolCacheMode,
+        ttl_seconds: dict[str, float],
+        max_entries: int,
+    ) -> None:
+        self._mode = mode
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._in_flight: dict[str, Future[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(tool_name: str, tool_input: dict[str, Any]) -> str:
+        canonical_input = json.dumps(tool_input, sort_keys=True, default=str)
+        return hashlib.blake2b(
+            f"{tool_name}:{canonical_input}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get_or_call(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        call: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Return the cached result for a tool call, calling the tool on a miss.
+
+        Args:
+            tool_name: Name of the tool being called
+            tool_input: Arguments passed to the tool
+            call: Zero-argument callable that runs the real tool
+
+        Returns:
+            Tool result dictionary
+
+        Raises:
+            LookupError: If the cache is in isolated mode and has no entry
+        """
+        if self._mode is ToolCacheMode.DISABLED:
+            return call()
+
+        key = self._make_key(tool_name, tool_input)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                logger.info("Tool cache hit: %s", tool_name)
+                return entry[1]
+
+            if self._mode is ToolCacheMode.ISOLATED:
+                raise LookupError(f"No cached result for {tool_name} in isolated mode")
+
+            pending = self._in_flight.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                self._in_flight[key] = pending
+
+        if not is_owner:
+            logger.info("Sharing in-flight result for duplicate call: %s", tool_name)
+            return pending.result()
+
+        try:
+            result = call()
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(result)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+        expires_at = time.monotonic() + self._ttl_seconds.get(
+            tool_name, TOOL_CACHE_DEFAULT_TTL_SECONDS
+        )
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return result
+
+
+# Prompts made up only of numbers, arithmetic operators and parentheses can be
+# answered locally instead of spending two model round-trips on a calculator call
+ARITHMETIC_PROMPT_PATTERN: re.Pattern[str] = re.compile(r"^\s*[\d.\s+\-*/()]+\s*$")
+CALCULATOR_FAST_PATH: bool = os.getenv("CALCULATOR_FAST_PATH", "true").lower() == "true"
+
+# Longer prompts go to the model; deeply nested input would otherwise exhaust
+# the parser's recursion limit
+ARITHMETIC_PROMPT_MAX_LENGTH: int = 200
+
+# Float results are rounded to this many significant digits, so binary
+# floating-point noise (0.1 + 0.2 = 0.30000000000000004) is not shown
+ARITHMETIC_RESULT_SIGNIFICANT_DIGITS: int = 12
+
+_ARITHMETIC_OPERATORS: dict[type[ast.operator], Callable[[float, float], float]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+def _evaluate_arithmetic(expression: str) -> float:
+    """
+    Safely evaluate an arithmetic expression using +, -, *, / and parentheses.
+
+    Args:
+        expression: Arithmetic expression to evaluate
+
+    Returns:
+        Numeric result of the expression
+
+    Raises:
+        ValueError: If the expression contains anything other than basic arithmetic,
+            has no binary operator, or is too deeply nested to evaluate
+        ZeroDivisionError: If the expression divides by zero
+    """
+
+    def _evaluate(node: ast.AST) -> float:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC_OPERATORS:
+            return _ARITHMETIC_OPERATORS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            value = _evaluate(node.operand)
+            return -value if isinstance(node.op, ast.USub) else value
+        raise ValueError(f"Unsupported arithmetic expression: {expression}")
+
+    if len(expression) > ARITHMETIC_PROMPT_MAX_LENGTH:
+        raise ValueError("Arithmetic expression is too long")
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+        # A bare number such as a year is not a calculation
+        if not any(isinstance(node, ast.BinOp) for node in ast.walk(tree)):
+            raise ValueError(f"No arithmetic operation in: {expression}")
+        return _evaluate(tree.body)
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Invalid arithmetic expression: {expression}") from e
+
+
+def _format_arithmetic_result(value: float) -> str:
+    """
+    Format an arithmetic result for display.
+
+    Args:
+        value: Result returned by _evaluate_arithmetic
+
+    Returns:
+        Integers as-is, floats rounded to ARITHMETIC_RESULT_SIGNIFICANT_DIGITS
+    """
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.{ARITHMETIC_RESULT_SIGNIFICANT_DIGITS}g}"
+
+
+def _tool_result(result: dict[str, Any]) -> dict[str, Any]:
+    """
+    Wrap a tool result as a Strands tool result with a JSON text block.
+
+    Strands falls back to str() for plain return values, which sends a Python
+    repr to the model; serializing here produces compact JSON instead.
+
+    Args:
+        result: Tool result dictionary
+
+    Returns:
+        Tool result in Strands ToolResult shape
+    """
+    return {"status": "success", "content": [{"text": _dumps(result)}]}
+
+
+tool_cache = ToolResultCache(
+    mode=ToolCacheMode(os.getenv("TOOL_CACHE_MODE", ToolCacheMode.ONLINE.value).lower()),
+    ttl_seconds=TOOL_CACHE_TTL_SECONDS,
+    max_entries=TOOL_CACHE_MAX_ENTRIES,
+)
+
+
 @tool
 def get_weather(city: str) -> dict[str, Any]:
     """
@@ -42,13 +297,11 @@ def get_weather(city: str) -> dict[str, Any]:
     Returns:
         Weather information including temperature, conditions, and humidity
     """
-    from tools.weather_tool import get_weather as weather_impl
-
-    logger.info(f"Getting weather for city: {city}")
-    result = weather_impl(city)
-    logger.debug(f"Weather result: {result}")
+    logger.info("Getting weather for city: %s", city)
+    result = tool_cache.get_or_call("get_weather", {"city": city}, lambda: weather_impl(city))
+    logger.debug("Weather result: %s", result)
 
-    return result
+    return _tool_result(result)
 
 
 @tool
@@ -62,13 +315,11 @@ def get_time(timezone: str) -> dict[str, Any]:
     Returns:
         Current time, date, timezone, and UTC offset information
     """
-    from tools.time_tool import get_time as time_impl
+    logger.info("Getting time for timezone: %s", timezone)
+    result = tool_cache.get_or_call("get_time", {"timezone": timezone}, lambda: time_impl(timezone))
+    logger.debug("Time result: %s", result)
 
-    logger.info(f"Getting time for timezone: {timezone}")
-    result = time_impl(timezone)
-    logger.debug(f"Time result: {result}")
-
-    return result
+    return _tool_result(result)
 
 
 @tool
@@ -84,71 +335,395 @@ def calculator(operation: str, a: float, b: float = None) -> dict[str, Any]:
     Returns:
         Calculation result with operation details
     """
-    from tools.calculator_tool import calculator as calc_impl
+    logger.info("Performing calculation: %s(%s, %s)", operation, a, b)
+    result = tool_cache.get_or_call(
+        "calculator",
+        {"operation": operation, "a": a, "b": b},
+        lambda: calc_impl(operation, a, b),
+    )
+    logger.debug("Calculator result: %s", result)
 
-    logger.info(f"Performing calculation: {operation}({a}, {b})")
-    result = calc_impl(operation, a, b)
-    logger.debug(f"Calculator result: {result}")
+    return _tool_result(result)
 
-    return result
 
+# Bedrock model configuration
+MODEL_ID: str = os.getenv("MODEL_ID", "us.anthropic.claude-haiku-4-5-20251001-v1:0")
+MODEL_REGION: str | None = os.getenv("AWS_REGION")
 
-# Initialize Bedrock model
-MODEL_ID = "us.anthropic.claude-haiku-4-5-20251001-v1:0"
-model = BedrockModel(model_id=MODEL_ID)
+# Model families served by Bedrock's latency-optimized inference
+LATENCY_OPTIMIZED_MODEL_FAMILIES: tuple[str, ...] = (
+    "anthropic.claude-3-5-haiku",
+    "amazon.nova-pro",
+    "meta.llama3-1-70b",
+    "meta.llama3-1-405b",
+)
 
-logger.info(f"Initializing Strands agent with model: {MODEL_ID}")
+# Requested Bedrock latency profile ("optimized" or "standard")
+BEDROCK_LATENCY: str = os.getenv("BEDROCK_LATENCY", "optimized")
 
 
-def _initialize_agent() -> Agent:
+def _model_in_families(model_id: str, families: tuple[str, ...]) -> bool:
     """
-    Initialize the agent with proper telemetry configuration.
+    Check whether a model ID belongs to one of the given model families.
+
+    Args:
+        model_id: Bedrock model ID or inference profile ID
+        families: Model family substrings to match
+
+    Returns:
+        True if the model ID matches any family
+    """
+    return any(family in model_id for family in families)
+
+
+# The pool is sized for concurrent invocations plus parallel tool turns; the
+# default of 10 connections would queue requests once several agent loops
+# are in flight. TCP keepalive stops idle pooled connections from being
+# silently dropped between invocations, which would force a new TLS handshake.
+# Passing a Config replaces the Strands default, so its 120s read timeout is
+# restated here; botocore's 60s default can cut off a long streamed response.
+BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=120,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_model(model_id: str, region: str | None) -> BedrockModel:
+    """
+    Get the Bedrock model for a model ID and region, building it on first use.
+
+    The model holds the bedrock-runtime client and no per-request state, so one
+    instance per (model_id, region) is shared by every agent in the process.
+    Do not add mutable per-request state to the returned model.
+
+    Args:
+        model_id: Bedrock model ID or inference profile ID
+        region: AWS region, or None for the default session region
+
+    Returns:
+        Configured BedrockModel instance
+    """
+    model_config: dict[str, Any] = {
+        # Call ConverseStream so text deltas and toolUse blocks are consumed as
+        # they are generated instead of after the whole response is buffered
+        "streaming": True,
+    }
+
+    if BEDROCK_LATENCY == "optimized" and _model_in_families(
+        model_id, LATENCY_OPTIMIZED_MODEL_FAMILIES
+    ):
+        # Route every model call in the agent loop to the low-latency endpoint
+        model_config["additional_args"] = {"performanceConfig": {"latency": "optimized"}}
+
+    logger.info("Initializing Bedrock model: %s", model_id)
+
+    return BedrockModel(
+        model_id=model_id,
+        region_name=region,
+        boto_client_config=BEDROCK_CLIENT_CONFIG,
+        **model_config,
+    )
+
+
+# Bedrock error codes that indicate a transient, service-side failure
+TRANSIENT_MODEL_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "ThrottlingException",
+        "ServiceUnavailableException",
+        "ModelTimeoutException",
+        "InternalServerException",
+    }
+)
+
+# Open the circuit after this many transient failures within the window. Every
+# throttled model attempt counts, and the window spans one full Strands retry
+# schedule (six attempts, ~124s of backoff), so a turn that keeps getting
+# throttled trips the breaker on its own.
+CIRCUIT_FAILURE_THRESHOLD: int = 5
+CIRCUIT_WINDOW_SECONDS: float = 180.0
+CIRCUIT_COOLDOWN_SECONDS: float = 30.0
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when invocations are short-circuited during a Bedrock outage."""
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker for model invocations.
+
+    Throttling and transient errors are already retried with backoff by the
+    botocore adaptive retry mode and the Strands event loop. Each throttled
+    attempt the event loop retries, and each invocation that still fails, is
+    recorded; once they pile up within the window the breaker rejects new
+    invocations for a cooldown period instead of starting agent loops that
+    cannot finish.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        window_seconds: float,
+        cooldown_seconds: float,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._window_seconds = window_seconds
+        self._cooldown_seconds = cooldown_seconds
+        self._failures: deque[float] = deque()
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Check the circuit before starting an invocation.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Bedrock is failing repeatedly; retry in {remaining:.0f} seconds"
+            )
+
+    def record_success(self) -> None:
+        """Reset the failure window after a successful invocation."""
+        with self._lock:
+            self._failures.clear()
+
+    def record_failure(self) -> None:
+        """Record a transient failure and open the circuit past the threshold."""
+        now = time.monotonic()
+        with self._lock:
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self._window_seconds:
+                self._failures.popleft()
+
+            if len(self._failures) >= self._failure_threshold:
+                self._open_until = now + self._cooldown_seconds
+                self._failures.clear()
+                logger.warning(
+                    "Opening model circuit breaker for %.0f seconds", self._cooldown_seconds
+                )
+
+
+def _is_transient_model_error(error: BaseException) -> bool:
+    """
+    Check whether an exception, or any exception it wraps, is a transient Bedrock error.
+
+    Args:
+        error: Exception raised by the agent invocation
+
+    Returns:
+        True if the failure was throttling or a transient service error
+    """
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, ModelThrottledException):
+            return True
+        if isinstance(current, ClientError):
+            return current.response.get("Error", {}).get("Code") in TRANSIENT_MODEL_ERROR_CODES
+        current = current.__cause__
+
+    return False
+
+
+model_circuit_breaker = CircuitBreaker(
+    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+    window_seconds=CIRCUIT_WINDOW_SECONDS,
+    cooldown_seconds=CIRCUIT_COOLDOWN_SECONDS,
+)
+
+# Static agent configuration, built once per process and shared by every
+# agent instance
+AGENT_TOOLS: list[Any] = [get_weather, get_time, calculator]
+AGENT_TOOL_NAMES: str = ", ".join(agent_tool.tool_name for agent_tool in AGENT_TOOLS)
+
+# Upper bound on messages re-sent to the model per turn; older turns are
+# trimmed so input tokens grow linearly rather than quadratically with the
+# number of agent loop iterations
+MAX_HISTORY_MESSAGES: int = int(os.getenv("MAX_HISTORY_MESSAGES", "20"))
+
+SYSTEM_PROMPT: str = (
+    "You are a helpful assistant with access to weather, time, and calculator tools. "
+    "Use these tools to accurately answer user questions. Always provide clear, "
+    "concise responses based on the tool outputs. When using tools:\n"
+    "- For weather: Use the city name directly\n"
+    "- For time: Use timezone format like 'America/New_York' or city names\n"
+    "- For calculator: Use operations like 'add', 'subtract', 'multiply', 'divide', or 'factorial'\n"
+    "Be friendly and helpful in your responses."
+)
+
+
+# Telemetry installs a process-wide OTLP exporter, so it is set up once per
+# container rather than once per agent
+_telemetry_initialized = False
+_telemetry_lock = threading.Lock()
+
+
+def _initialize_telemetry() -> None:
+    """
+    Initialize Braintrust telemetry on the first invocation only.
 
     This function is called lazily to ensure environment variables
     (especially Braintrust configuration) are set before telemetry
     initialization.
+    """
+    global _telemetry_initialized
+
+    if _telemetry_initialized:
+        return
+
+    with _telemetry_lock:
+        if _telemetry_initialized:
+            return
+
+        # Initialize Braintrust telemetry if configured
+        braintrust_api_key = os.getenv("BRAINTRUST_API_KEY")
+        if braintrust_api_key:
+            logger.info("Braintrust observability enabled - initializing telemetry")
+            try:
+                from strands.telemetry import StrandsTelemetry
+
+                strands_telemetry = StrandsTelemetry()
+                strands_telemetry.setup_otlp_exporter()
+                logger.info("Strands telemetry initialized successfully")
+            except Exception as e:
+                logger.warning("Failed to initialize Strands telemetry: %s", e)
+                logger.warning("Continuing without Braintrust observability")
+        else:
+            logger.info("Braintrust observability not configured (CloudWatch only)")
+
+        _telemetry_initialized = True
+
+
+def _initialize_agent() -> Agent:
+    """
+    Initialize an agent for one invocation.
+
+    Each invocation gets its own agent, and so its own conversation history,
+    so concurrent callers never share or wait on each other's messages. The
+    model, its bedrock-runtime client and the tools are built once and reused.
 
     Returns:
         Configured Strands Agent instance
     """
-    # Initialize Braintrust telemetry if configured
-    braintrust_api_key = os.getenv("BRAINTRUST_API_KEY")
-    if braintrust_api_key:
-        logger.info("Braintrust observability enabled - initializing telemetry")
-        try:
-            from strands.telemetry import StrandsTelemetry
-
-            strands_telemetry = StrandsTelemetry()
-            strands_telemetry.setup_otlp_exporter()
-            logger.info("Strands telemetry initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Strands telemetry: {e}")
-            logger.warning("Continuing without Braintrust observability")
-    else:
-        logger.info("Braintrust observability not configured (CloudWatch only)")
-
-    # Create and return the agent
+    _initialize_telemetry()
+
     agent = Agent(
-        model=model,
-        tools=[get_weather, get_time, calculator],
-        system_prompt=(
-            "You are a helpful assistant with access to weather, time, and calculator tools. "
-            "Use these tools to accurately answer user questions. Always provide clear, "
-            "concise responses based on the tool outputs. When using tools:\n"
-            "- For weather: Use the city name directly\n"
-            "- For time: Use timezone format like 'America/New_York' or city names\n"
-            "- For calculator: Use operations like 'add', 'subtract', 'multiply', 'divide', or 'factorial'\n"
-            "Be friendly and helpful in your responses."
-        ),
+        model=_get_model(MODEL_ID, MODEL_REGION),
+        tools=AGENT_TOOLS,
+        # Run independent tool calls from the same model turn in parallel
+        # (e.g. weather + time for one city) so turn latency tracks the
+        # slowest tool instead of the sum of all of them
+        tool_executor=ConcurrentToolExecutor(),
+        system_prompt=SYSTEM_PROMPT,
+        # Trims whole turns only, so a toolUse is never sent without its toolResult
+        conversation_manager=SlidingWindowConversationManager(window_size=MAX_HISTORY_MESSAGES),
     )
 
-    logger.info("Agent initialized with tools: get_weather, get_time, calculator")
+    logger.debug("Agent initialized with tools: %s", AGENT_TOOL_NAMES)
 
     return agent
 
 
+async def _run_events(agent: Agent, prompt: str) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Run the agent loop and yield intermediate state as it happens.
+
+    Closing the generator (e.g. when the caller disconnects) stops the agent
+    loop, so abandoned requests stop consuming model and tool calls.
+
+    Args:
+        agent: Strands agent to run
+        prompt: User prompt
+
+    Yields:
+        (event_type, payload) tuples where event_type is one of:
+        "text_delta" (str), "tool_use" (toolUse block), "tool_result"
+        (toolResult block), "throttled" (retry delay in seconds) or "final"
+        (AgentResult)
+    """
+    async for event in agent.stream_async(prompt):
+        if "data" in event:
+            yield "text_delta", event["data"]
+        elif "event_loop_throttled_delay" in event:
+            yield "throttled", event["event_loop_throttled_delay"]
+        elif "message" in event:
+            for block in event["message"]["content"]:
+                if tool_use := block.get("toolUse"):
+                    yield "tool_use", tool_use
+                elif tool_result := block.get("toolResult"):
+                    yield "tool_result", tool_result
+        elif "result" in event:
+            yield "final", event["result"]
+
+
+# Streamed between the text of consecutive model turns in one reply
+TURN_SEPARATOR: str = "\n\n"
+
+
+async def _stream_reply(agent: Agent, prompt: str) -> AsyncIterator[str]:
+    """
+    Run the agent and yield its reply text as the model produces it.
+
+    Text the model writes before a tool call (e.g. "Let me check that") is
+    streamed too; a blank line separates it from the text of the next turn so
+    turns are not glued together in the joined reply.
+
+    Args:
+        agent: Strands agent to run
+        prompt: User prompt
+
+    Yields:
+        Chunks of agent response text
+
+    Raises:
+        RuntimeError: If the agent loop ends without a result
+    """
+    response: AgentResult | None = None
+    text_sent = False
+    separator_pending = False
+    try:
+        async for event_type, event_payload in _run_events(agent, prompt):
+            if event_type == "text_delta":
+                if separator_pending:
+                    yield TURN_SEPARATOR
+                    separator_pending = False
+                text_sent = True
+                yield event_payload
+            elif event_type == "tool_use":
+                separator_pending = text_sent
+                logger.info("Tool requested: %s", event_payload["name"])
+            elif event_type == "tool_result":
+                logger.info("Tool completed with status: %s", event_payload["status"])
+            elif event_type == "throttled":
+                # Strands retries the throttled call itself; count the attempt
+                logger.warning("Model throttled, retrying in %s seconds", event_payload)
+                model_circuit_breaker.record_failure()
+            elif event_type == "final":
+                response = event_payload
+    except Exception as e:
+        if _is_transient_model_error(e):
+            model_circuit_breaker.record_failure()
+        raise
+
+    model_circuit_breaker.record_success()
+
+    if response is None:
+        raise RuntimeError("Agent finished without producing a result")
+
+    logger.info("Agent invocation completed successfully")
+    logger.debug("Response: %s", response)
+
+
 @app.entrypoint
-def strands_agent_bedrock(payload: dict[str, Any]) -> str:
+async def strands_agent_bedrock(payload: dict[str, Any]) -> str | AsyncIterator[str]:
     """
     Entry point for AgentCore Runtime invocation.
 
@@ -156,6 +731,13 @@ def strands_agent_bedrock(payload: dict[str, Any]) -> str:
     for the AgentCore Runtime. When deployed, the agent initializes Strands telemetry
     which provides OpenTelemetry instrumentation.
 
+    Model-backed replies are returned as an async generator, which the Runtime
+    streams as server-sent events: text is sent to the caller as the model
+    produces it instead of after the whole agent loop has finished. Checks that
+    can reject the request (the circuit breaker) run before the stream is
+    returned, so they fail with an error response rather than a started stream.
+    Errors raised mid-stream reach the caller as an event with an "error" key.
+
     Telemetry Configuration:
     - When BRAINTRUST_API_KEY env var is set: Strands telemetry is initialized to export
       OTEL traces to Braintrust via OTEL_EXPORTER_OTLP_* environment variables
@@ -165,25 +747,33 @@ def strands_agent_bedrock(payload: dict[str, Any]) -> str:
         payload: Input payload containing the user prompt
 
     Returns:
-        Agent response text
+        The answer text for locally answered arithmetic prompts, otherwise a
+        stream of agent response text chunks
+
+    Raises:
+        CircuitOpenError: If Bedrock calls are being short-circuited
     """
     user_input = payload.get("prompt", "")
 
-    logger.info(f"Agent invoked with prompt: {user_input}")
-
-    # Initialize agent with proper configuration (lazy initialization)
-    agent = _initialize_agent()
+    logger.info("Agent invoked with prompt: %s", user_input)
 
-    # Invoke the Strands agent
-    response = agent(user_input)
+    # Answer bare arithmetic locally; anything the evaluator rejects goes to the model
+    if CALCULATOR_FAST_PATH and ARITHMETIC_PROMPT_PATTERN.match(user_input):
+        try:
+            value = _evaluate_arithmetic(user_input)
+        except (ValueError, ZeroDivisionError):
+            pass
+        else:
+            logger.info("Answered arithmetic prompt locally (fast_path=true)")
+            return f"{user_input.strip()} = {_format_arithmetic_result(value)}"
 
-    # Extract response text
-    response_text = response.message["content"][0]["text"]
+    # Fail fast while Bedrock is in a sustained outage
+    model_circuit_breaker.before_call()
 
-    logger.info("Agent invocation completed successfully")
-    logger.debug(f"Response: {response_text}")
+    # Initialize agent with proper configuration
+    agent = _initialize_agent()
 
-    return response_text
+    return _stream_reply(agent, user_input)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,9 @@ This script deletes a deployed agent from Amazon Bedrock AgentCore Runtime.
 """
 
 import argparse
+import json
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -19,14 +21,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# CLI output
+BANNER: str = "=" * 70
+
+
 def _load_deployment_metadata(script_dir: Path) -> dict:
     """Load deployment metadata from .deployment_metadata.json file."""
-    import json
-
     metadata_file = script_dir / ".deployment_metadata.json"
     if metadata_file.exists():
         try:
-            return json.loads(metadata_file.read_text())
+            with metadata_file.open("rb") as f:
+                return json.load(f)
         except json.JSONDecodeError:
             return {}
     return {}
@@ -40,29 +45,36 @@ def _delete_agent(agent_id: str, region: str) -> None:
         agent_id: The agent ID to delete
         region: AWS region
     """
-    logger.info(f"Deleting agent: {agent_id}")
-    logger.info(f"Region: {region}")
+    logger.info(f"Deleting agent: {agent_id}\nRegion: {region}")
 
     try:
         import boto3
+        from botocore.config import Config
 
         # Delete the agent endpoint using boto3
-        client = boto3.client("bedrock-agentcore", region_name=region)
+        client = boto3.client(
+            "bedrock-agentcore",
+            region_name=region,
+            config=Config(tcp_keepalive=True, retries={"max_attempts": 10, "mode": "adaptive"}),
+        )
 
         logger.info("Deleting agent runtime endpoint...")
         client.delete_agent_runtime_endpoint(agentId=agent_id, endpointName="DEFAULT")
 
-        logger.info("=" * 70)
-        logger.info("AGENT DELETED SUCCESSFULLY")
-        logger.info("=" * 70)
-        logger.info(f"Agent ID: {agent_id}")
-        logger.info("The agent has been removed from AgentCore Runtime")
+        logger.info(
+            "\n".join(
+                [
+                    BANNER,
+                    "AGENT DELETED SUCCESSFULLY",
+                    BANNER,
+                    f"Agent ID: {agent_id}",
+                    "The agent has been removed from AgentCore Runtime",
+                ]
+            )
+        )
 
     except Exception as e:
-        logger.error("=" * 70)
-        logger.error("DELETION FAILED")
-        logger.error("=" * 70)
-        logger.error(f"Error: {str(e)}")
+        logger.error("\n".join([BANNER, "DELETION FAILED", BANNER, f"Error: {str(e)}"]))
         raise RuntimeError(f"Agent deletion failed: {str(e)}") from e
 
 
@@ -115,7 +127,7 @@ Environment variables:
         sys.exit(1)
 
     # Get region
-    region = args.region or metadata.get("region") or __import__("os").environ.get("AWS_REGION")
+    region = args.region or metadata.get("region") or os.environ.get("AWS_REGION")
     if not region:
         logger.error("No region specified")
         logger.error(
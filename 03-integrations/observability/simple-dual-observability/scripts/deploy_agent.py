@@ -7,11 +7,18 @@ with automatic Docker containerization and OTEL instrumentation.
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
+import random
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import boto3
 
 # Configure logging
 logging.basicConfig(
@@ -22,7 +29,99 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _validate_environment() -> None:
+# Agent runtime readiness polling
+AGENT_READY_STATUS: str = "READY"
+AGENT_FAILED_STATUSES: frozenset[str] = frozenset(
+    {"CREATE_FAILED", "UPDATE_FAILED", "DELETE_FAILED"}
+)
+READY_POLL_INITIAL_DELAY_SECONDS: float = 0.5
+READY_POLL_MAX_DELAY_SECONDS: float = 15.0
+READY_POLL_BACKOFF_FACTOR: float = 3.0
+READY_MAX_WAIT_SECONDS: float = 600.0
+
+# Status-check errors worth polling through; anything else is re-raised
+TRANSIENT_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "ThrottlingException",
+        "Throttling",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "ServiceUnavailableException",
+        "InternalServerException",
+    }
+)
+
+# AWS error codes reported when the deploying principal lacks a permission
+ACCESS_DENIED_ERROR_CODES: frozenset[str] = frozenset({"AccessDenied", "AccessDeniedException"})
+
+# CLI output
+BANNER: str = "=" * 60
+ERROR_BANNER: str = "=" * 70
+DEPLOY_EPILOG: str = """
+Example usage:
+    # Deploy with CloudWatch observability only (default)
+    uv run python deploy_agent.py
+
+    # Deploy with Braintrust observability
+    uv run python deploy_agent.py \\
+        --braintrust-api-key YOUR_KEY \\
+        --braintrust-project-id YOUR_PROJECT_ID
+
+    # Deploy to specific region
+    uv run python deploy_agent.py --region us-west-2
+
+    # Deploy with custom agent name
+    uv run python deploy_agent.py --name MyCustomAgent
+
+    # Update existing agent (auto-update on conflict)
+    uv run python deploy_agent.py --auto-update-on-conflict
+
+Environment variables:
+    BRAINTRUST_API_KEY: Braintrust API key (alternative to --braintrust-api-key)
+    BRAINTRUST_PROJECT_ID: Braintrust project ID (alternative to --braintrust-project-id)
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _get_session(region: str) -> "boto3.Session":
+    """
+    Get the boto3 session for a region, creating it on first use.
+
+    All AWS clients in this script are created from this session, so the
+    credential provider chain and config files are resolved once per run.
+
+    Args:
+        region: AWS region
+
+    Returns:
+        Shared boto3 session
+    """
+    import boto3
+
+    return boto3.Session(region_name=region)
+
+
+def _create_client(region: str, service_name: str):
+    """
+    Create an AWS client from the shared session.
+
+    Clients keep pooled connections alive between calls and use adaptive
+    retries, which rate-limit client-side and only back off on real throttling.
+
+    Args:
+        region: AWS region
+        service_name: AWS service name, e.g. "sts"
+
+    Returns:
+        Configured boto3 client
+    """
+    from botocore.config import Config
+
+    config = Config(tcp_keepalive=True, retries={"max_attempts": 10, "mode": "adaptive"})
+    return _get_session(region).client(service_name, config=config)
+
+
+def _validate_environment(region: str) -> None:
     """Validate required environment and dependencies."""
     try:
         import boto3  # noqa: F401
@@ -43,19 +142,53 @@ def _validate_environment() -> None:
     # - Config file
     # We don't care which - just validate it works
     try:
-        sts = boto3.client("sts")
+        sts = _create_client(region, "sts")
         identity = sts.get_caller_identity()
         logger.info(f"AWS Account ID: {identity['Account']}")
         logger.info(f"AWS Identity ARN: {identity['Arn']}")
 
     except Exception as e:
-        logger.error(f"Failed to validate AWS credentials: {e}")
-        logger.error("")
-        logger.error("Ensure AWS credentials are configured.")
-        logger.error("Test with: aws sts get-caller-identity")
+        logger.error(
+            "\n".join(
+                [
+                    f"Failed to validate AWS credentials: {e}",
+                    "",
+                    "Ensure AWS credentials are configured.",
+                    "Test with: aws sts get-caller-identity",
+                ]
+            )
+        )
         sys.exit(1)
 
 
+def _is_access_denied(error: BaseException) -> bool:
+    """
+    Check whether an error, or any error it was raised from, is an AWS access denial.
+
+    The starter toolkit may wrap the botocore ClientError, so the whole
+    exception chain is inspected.
+
+    Args:
+        error: Exception raised by the toolkit
+
+    Returns:
+        True if the failure was caused by missing IAM permissions
+    """
+    from botocore.exceptions import ClientError
+
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, ClientError):
+            error_code = current.response.get("Error", {}).get("Code")
+            if error_code in ACCESS_DENIED_ERROR_CODES:
+                return True
+        current = current.__cause__ or current.__context__
+
+    # Errors the toolkit re-raises without the original exception attached
+    error_msg = str(error)
+    return "codebuild:CreateProject" in error_msg or "AccessDeniedException" in error_msg
+
+
 def _deploy_agent(
     agent_name: str,
     region: str,
@@ -92,13 +225,17 @@ def _deploy_agent(
     enable_braintrust = bool(braintrust_api_key and braintrust_project_id)
 
     # Configure the agent
-    logger.info("Configuring agent deployment...")
-    logger.info(f"  Agent name: {agent_name}")
-    logger.info(f"  Entrypoint: {entrypoint}")
-    logger.info(f"  Requirements: {requirements_file}")
-    logger.info(f"  Region: {region}")
     logger.info(
-        f"  Braintrust observability: {'Enabled' if enable_braintrust else 'Disabled (CloudWatch only)'}"
+        "\n".join(
+            [
+                "Configuring agent deployment...",
+                f"  Agent name: {agent_name}",
+                f"  Entrypoint: {entrypoint}",
+                f"  Requirements: {requirements_file}",
+                f"  Region: {region}",
+                f"  Braintrust observability: {'Enabled' if enable_braintrust else 'Disabled (CloudWatch only)'}",
+            ]
+        )
     )
 
     configure_kwargs = {
@@ -121,15 +258,24 @@ def _deploy_agent(
     configure_response = agentcore_runtime.configure(**configure_kwargs)
 
     logger.info("Agent configuration completed")
-    logger.info(f"Configuration response: {json.dumps(configure_response, indent=2, default=str)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Configuration response: %s", json.dumps(configure_response, indent=2, default=str)
+        )
 
     # Launch the agent
-    logger.info("Launching agent to AgentCore Runtime...")
-    logger.info("This will:")
-    logger.info("  1. Build Docker container with your agent code")
-    logger.info("  2. Push container to Amazon ECR")
-    logger.info("  3. Deploy to AgentCore Runtime")
-    logger.info("  This may take several minutes...")
+    logger.info(
+        "\n".join(
+            [
+                "Launching agent to AgentCore Runtime...",
+                "This will:",
+                "  1. Build Docker container with your agent code",
+                "  2. Push container to Amazon ECR",
+                "  3. Deploy to AgentCore Runtime",
+                "  This may take several minutes...",
+            ]
+        )
+    )
 
     try:
         launch_kwargs = {
@@ -151,25 +297,31 @@ def _deploy_agent(
         error_msg = str(e)
 
         # Check for common IAM permission errors
-        if "codebuild:CreateProject" in error_msg or "AccessDeniedException" in error_msg:
-            logger.error("=" * 70)
-            logger.error("IAM PERMISSION ERROR")
-            logger.error("=" * 70)
-            logger.error("The deployment requires additional IAM permissions.")
-            logger.error("")
-            logger.error("Missing permission: codebuild:CreateProject")
-            logger.error("")
-            logger.error("Solution:")
-            logger.error("  1. Attach the policy from: docs/iam-policy-deployment.json")
-            logger.error("")
-            logger.error("  Using AWS CLI:")
-            logger.error("     aws iam put-role-policy \\")
-            logger.error("       --role-name YOUR_ROLE_NAME \\")
-            logger.error("       --policy-name BedrockAgentCoreDeployment \\")
-            logger.error("       --policy-document file://docs/iam-policy-deployment.json")
-            logger.error("")
-            logger.error("  Or see README for complete IAM setup instructions.")
-            logger.error("=" * 70)
+        if _is_access_denied(e):
+            logger.error(
+                "\n".join(
+                    [
+                        ERROR_BANNER,
+                        "IAM PERMISSION ERROR",
+                        ERROR_BANNER,
+                        "The deployment requires additional IAM permissions.",
+                        "",
+                        "Missing permission: codebuild:CreateProject",
+                        "",
+                        "Solution:",
+                        "  1. Attach the policy from: docs/iam-policy-deployment.json",
+                        "",
+                        "  Using AWS CLI:",
+                        "     aws iam put-role-policy \\",
+                        "       --role-name YOUR_ROLE_NAME \\",
+                        "       --policy-name BedrockAgentCoreDeployment \\",
+                        "       --policy-document file://docs/iam-policy-deployment.json",
+                        "",
+                        "  Or see README for complete IAM setup instructions.",
+                        ERROR_BANNER,
+                    ]
+                )
+            )
 
         # Re-raise the exception with more context
         raise RuntimeError(f"Deployment failed: {error_msg}") from e
@@ -181,9 +333,7 @@ def _deploy_agent(
     agent_arn = launch_result.agent_arn
     ecr_uri = launch_result.ecr_uri
 
-    logger.info(f"Agent ID: {agent_id}")
-    logger.info(f"Agent ARN: {agent_arn}")
-    logger.info(f"ECR URI: {ecr_uri}")
+    logger.info(f"Agent ID: {agent_id}\nAgent ARN: {agent_arn}\nECR URI: {ecr_uri}")
 
     # Save deployment info
     deployment_info = {
@@ -198,21 +348,101 @@ def _deploy_agent(
     return deployment_info
 
 
-def _wait_for_agent_ready(agent_id: str, region: str) -> None:
+def _wait_for_agent_ready(
+    agent_id: str,
+    region: str,
+    max_wait_seconds: float = READY_MAX_WAIT_SECONDS,
+) -> None:
     """
-    Wait for agent to be ready.
+    Wait for agent runtime to reach READY status.
+
+    Polls with exponential backoff and decorrelated jitter: each delay is drawn
+    between 0.5s and 3x the previous delay, capped at 15s. A deployment that is
+    already ready returns after one status call, a slow one is not polled every
+    few seconds, and throttled retries don't fire in lockstep.
 
-    The launch() method already waits for the agent to be ready,
-    so this is just a placeholder for now.
+    Throttling, 5xx and connection errors are polled through; any other error
+    (e.g. ValidationException, ResourceNotFoundException, AccessDeniedException)
+    is raised immediately.
 
     Args:
         agent_id: Agent ID to check
         region: AWS region
+        max_wait_seconds: Total time budget for the wait
+
+    Raises:
+        RuntimeError: If the agent runtime ends in a failed status
+        TimeoutError: If the agent is not ready within max_wait_seconds
+        ClientError: If a status check fails with a non-retryable error
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    client = _create_client(region, "bedrock-agentcore-control")
+
+    deadline = time.monotonic() + max_wait_seconds
+    delay = READY_POLL_INITIAL_DELAY_SECONDS
+
+    while True:
+        try:
+            status = client.get_agent_runtime(agentRuntimeId=agent_id)["status"]
+        except (ClientError, BotoCoreError) as e:
+            if isinstance(e, ClientError):
+                error = e.response.get("Error", {})
+                status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+                if error.get("Code") not in TRANSIENT_ERROR_CODES and status_code < 500:
+                    raise
+
+            # Transient API error: retry soon instead of at the grown delay
+            logger.warning(f"Failed to get agent status: {e}")
+            delay = READY_POLL_INITIAL_DELAY_SECONDS
+        else:
+            if status == AGENT_READY_STATUS:
+                logger.info("Agent is ready")
+                return
+
+            if status in AGENT_FAILED_STATUSES:
+                raise RuntimeError(f"Agent deployment failed with status: {status}")
+
+            logger.info(f"Agent status: {status}")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Agent {agent_id} not ready after {max_wait_seconds:.0f} seconds")
+
+        time.sleep(min(delay, remaining))
+        delay = min(
+            random.uniform(READY_POLL_INITIAL_DELAY_SECONDS, delay * READY_POLL_BACKOFF_FACTOR),
+            READY_POLL_MAX_DELAY_SECONDS,
+        )
+
+
+def _write_small_file(path: Path, data: str) -> None:
     """
-    logger.info("Agent deployment completed successfully")
-    logger.info("The launch() method already verified the agent is ready")
-    # No additional status check needed - launch() already handles this
-    return
+    Atomically replace a file with a small payload.
+
+    The payload is written to a temporary file next to the target, flushed to
+    disk with fsync, and then renamed over the target, so readers never see a
+    partially written file even if the deploy or the machine goes down midway.
+
+    Args:
+        path: File to create or replace
+        data: Text content to write
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    payload = memoryview(data.encode("utf-8"))
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # os.write may write fewer bytes than requested
+            while payload:
+                payload = payload[os.write(fd, payload) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _save_deployment_info(deployment_info: dict, script_dir: Path) -> None:
@@ -225,7 +455,7 @@ def _save_deployment_info(deployment_info: dict, script_dir: Path) -> None:
     """
     # Save deployment metadata as single source of truth
     metadata_file = script_dir / ".deployment_metadata.json"
-    metadata_file.write_text(json.dumps(deployment_info, indent=2))
+    _write_small_file(metadata_file, json.dumps(deployment_info, indent=2))
     logger.info(f"Deployment metadata saved to: {metadata_file}")
 
 
@@ -234,29 +464,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Deploy Strands agent to Amazon Bedrock AgentCore Runtime",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Example usage:
-    # Deploy with CloudWatch observability only (default)
-    uv run python deploy_agent.py
-
-    # Deploy with Braintrust observability
-    uv run python deploy_agent.py \\
-        --braintrust-api-key YOUR_KEY \\
-        --braintrust-project-id YOUR_PROJECT_ID
-
-    # Deploy to specific region
-    uv run python deploy_agent.py --region us-west-2
-
-    # Deploy with custom agent name
-    uv run python deploy_agent.py --name MyCustomAgent
-
-    # Update existing agent (auto-update on conflict)
-    uv run python deploy_agent.py --auto-update-on-conflict
-
-Environment variables:
-    BRAINTRUST_API_KEY: Braintrust API key (alternative to --braintrust-api-key)
-    BRAINTRUST_PROJECT_ID: Braintrust project ID (alternative to --braintrust-project-id)
-""",
+        epilog=DEPLOY_EPILOG,
     )
 
     parser.add_argument(
@@ -331,20 +539,24 @@ Environment variables:
         )
         enable_braintrust = False
 
-    logger.info("=" * 60)
-    logger.info("AGENTCORE AGENT DEPLOYMENT")
-    logger.info("=" * 60)
-    logger.info(f"Agent name: {args.name}")
-    logger.info(f"Region: {args.region}")
-    logger.info(f"Entrypoint: {args.entrypoint}")
-    logger.info(f"Requirements: {args.requirements}")
     logger.info(
-        f"Braintrust observability: {'Enabled' if enable_braintrust else 'Disabled (CloudWatch only)'}"
+        "\n".join(
+            [
+                BANNER,
+                "AGENTCORE AGENT DEPLOYMENT",
+                BANNER,
+                f"Agent name: {args.name}",
+                f"Region: {args.region}",
+                f"Entrypoint: {args.entrypoint}",
+                f"Requirements: {args.requirements}",
+                f"Braintrust observability: {'Enabled' if enable_braintrust else 'Disabled (CloudWatch only)'}",
+                BANNER,
+            ]
+        )
     )
-    logger.info("=" * 60)
 
     # Validate environment
-    _validate_environment()
+    _validate_environment(args.region)
 
     # Change to parent directory for deployment
     os.chdir(parent_dir)
@@ -362,26 +574,33 @@ Environment variables:
         auto_update_on_conflict=args.auto_update_on_conflict,
     )
 
+    # Save deployment information before waiting, so a failed readiness check
+    # still leaves the metadata needed to test or delete the launched agent
+    _save_deployment_info(deployment_info, script_dir)
+
     # Wait for agent to be ready
     _wait_for_agent_ready(agent_id=deployment_info["agent_id"], region=args.region)
 
-    # Save deployment information
-    _save_deployment_info(deployment_info, script_dir)
-
     # Print success message
-    logger.info("")
-    logger.info("=" * 60)
-    logger.info("DEPLOYMENT COMPLETE")
-    logger.info("=" * 60)
-    logger.info(f"Agent ID: {deployment_info['agent_id']}")
-    logger.info(f"Agent ARN: {deployment_info['agent_arn']}")
-    logger.info(f"Region: {args.region}")
-    logger.info("")
-    logger.info("Next Steps:")
-    logger.info("1. Test the agent: ./scripts/tests/test_agent.py --test weather")
-    logger.info("2. Check logs: ./scripts/check_logs.sh --time 30m")
-    logger.info("3. Run observability demo: uv run python simple_observability.py --scenario all")
-    logger.info("=" * 60)
+    logger.info(
+        "\n".join(
+            [
+                "",
+                BANNER,
+                "DEPLOYMENT COMPLETE",
+                BANNER,
+                f"Agent ID: {deployment_info['agent_id']}",
+                f"Agent ARN: {deployment_info['agent_arn']}",
+                f"Region: {args.region}",
+                "",
+                "Next Steps:",
+                "1. Test the agent: ./scripts/tests/test_agent.py --test weather",
+                "2. Check logs: ./scripts/check_logs.sh --time 30m",
+                "3. Run observability demo: uv run python simple_observability.py --scenario all",
+                BANNER,
+            ]
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -30,6 +30,8 @@ from typing import Any
 import boto3
 from botocore.exceptions import ClientError
 
+from agent.streaming import read_agent_response
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -144,20 +146,13 @@ def _invoke_agent(
             agentRuntimeArn=agent_arn, runtimeSessionId=session_id, payload=payload
         )
 
-        # Handle StreamingBody response
-        agent_response = None
-        if "response" in response:
-            response_body = response["response"]
-            if hasattr(response_body, "read"):
-                raw_data = response_body.read()
-                if isinstance(raw_data, bytes):
-                    agent_response = raw_data.decode("utf-8")
+        agent_response = read_agent_response(response)
 
         elapsed_time = time.time() - start_time
 
         return {
             "success": True,
-            "output": agent_response or "",
+            "output": agent_response,
             "trace_id": response.get("traceId", ""),
             "session_id": session_id,
             "elapsed_time": elapsed_time,
@@ -272,7 +267,7 @@ def _run_load_test(
         if result["success"]:
             stats["successful_requests"] += 1
             logger.info(f"[{request_count}] ✓ Success ({result['elapsed_time']:.2f}s)")
-            logger.debug(f"[{request_count}] Response: {result['output'][:100]}...")
+            logger.debug("[%d] Response: %.100s...", request_count, result["output"])
         else:
             stats["failed_requests"] += 1
             stats["by_type"][query_type]["errors"] += 1
@@ -288,7 +283,7 @@ def _run_load_test(
             )
 
         if result["trace_id"]:
-            logger.debug(f"[{request_count}] Trace ID: {result['trace_id']}")
+            logger.debug("[%d] Trace ID: %s", request_count, result["trace_id"])
 
         logger.info("")
 
@@ -6,6 +6,7 @@ This script invokes the agent with test prompts and displays responses.
 """
 
 import argparse
+import functools
 import json
 import logging
 import sys
@@ -15,6 +16,8 @@ from typing import Any
 import boto3
 from botocore.exceptions import ClientError
 
+from agent.streaming import read_agent_response
+
 # Configure logging with basicConfig
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +49,12 @@ def _load_agent_metadata(script_dir: Path) -> dict[str, Any]:
         )
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(region: str) -> boto3.client:
+    """Get the Bedrock AgentCore client for a region, creating it on first use."""
+    return boto3.client("bedrock-agentcore", region_name=region)
+
+
 def _invoke_agent(
     agent_arn: str, prompt: str, region: str, session_id: str | None = None
 ) -> dict[str, Any]:
@@ -63,7 +72,7 @@ def _invoke_agent(
     """
     import uuid
 
-    client = boto3.client("bedrock-agentcore", region_name=region)
+    client = _get_client(region)
 
     # Generate session ID if not provided
     if not session_id:
@@ -77,20 +86,7 @@ def _invoke_agent(
             agentRuntimeArn=agent_arn, runtimeSessionId=session_id, payload=payload
         )
 
-        # Parse response - handle StreamingBody
-        agent_response = None
-        if "response" in response:
-            response_body = response["response"]
-
-            # Handle StreamingBody
-            if hasattr(response_body, "read"):
-                raw_data = response_body.read()
-                if isinstance(raw_data, bytes):
-                    agent_response = raw_data.decode("utf-8")
-                else:
-                    agent_response = str(raw_data)
-            elif isinstance(response_body, str):
-                agent_response = response_body
+        agent_response = read_agent_response(response)
 
         return {"response": agent_response, "session_id": session_id, "raw_response": response}
 
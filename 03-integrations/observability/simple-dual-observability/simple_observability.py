@@ -16,18 +16,27 @@ Architecture:
 Agent runs in AgentCore Runtime - a fully managed service for hosting agents.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import json
 import logging
 import os
+import re
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from agent.streaming import read_agent_response
 
-import boto3
-from botocore.exceptions import ClientError
+# boto3/botocore are imported where they are first used so that argument
+# parsing, --help and early validation errors don't pay their import cost
+if TYPE_CHECKING:
+    import boto3
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +50,33 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_REGION: str = "us-east-1"
 DEFAULT_TIMEOUT: int = 300
+CONNECT_TIMEOUT: int = 5
+TRACE_PROPAGATION_WAIT_SECONDS: int = 10
+TRACE_POLL_DELAYS_SECONDS: tuple[float, ...] = (0.5, 0.75, 1.1, 1.6, 2.4, 3.6)
+TRACE_POLL_FALLBACK_WAIT_SECONDS: int = 5
+XRAY_TRACE_ID_PATTERN: re.Pattern[str] = re.compile(r"^1-[0-9a-f]{8}-[0-9a-f]{24}$")
+W3C_TRACE_ID_PATTERN: re.Pattern[str] = re.compile(r"^[0-9a-f]{32}$")
+SUCCESS_SCENARIO_QUERY: str = "What's the weather in Seattle and what time is it there?"
+ERROR_SCENARIO_QUERY: str = "Calculate the factorial of -5"
+BANNER: str = "=" * 80
+DEMO_EPILOG: str = """
+Examples:
+    # Run all scenarios (reads agent ID from .deployment_metadata.json)
+    python simple_observability.py --scenario all
+
+    # Run specific scenario
+    python simple_observability.py --scenario success
+
+    # Override agent ID
+    python simple_observability.py --agent-id abc123 --scenario all
+
+    # With environment variables
+    export AGENTCORE_AGENT_ID=abc123
+    python simple_observability.py
+
+    # Enable debug logging
+    python simple_observability.py --debug
+"""
 
 
 def _get_env_var(var_name: str, default: str | None = None, required: bool = False) -> str | None:
@@ -104,6 +140,22 @@ def _is_braintrust_enabled(metadata: dict[str, Any] | None) -> bool:
     return metadata.get("braintrust_enabled", False)
 
 
+@functools.lru_cache(maxsize=4)
+def _get_session(region: str) -> boto3.Session:
+    """
+    Get the boto3 session for a region, creating it on first use.
+
+    Args:
+        region: AWS region
+
+    Returns:
+        Shared boto3 session
+    """
+    import boto3
+
+    return boto3.Session(region_name=region)
+
+
 def _create_bedrock_client(region: str) -> boto3.client:
     """
     Create Amazon Bedrock AgentCore client.
@@ -114,8 +166,19 @@ def _create_bedrock_client(region: str) -> boto3.client:
     Returns:
         Configured boto3 client
     """
+    from botocore.config import Config
+
+    # Agent invocations can run well past botocore's 60s default read timeout;
+    # keep the connection alive and sized for the concurrent scenario calls
+    config = Config(
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=DEFAULT_TIMEOUT,
+        tcp_keepalive=True,
+        max_pool_connections=4,
+    )
+
     try:
-        client = boto3.client("bedrock-agentcore", region_name=region)
+        client = _get_session(region).client("bedrock-agentcore", config=config)
         logger.info(f"Created Bedrock AgentCore client for region: {region}")
         return client
 
@@ -138,6 +201,76 @@ def _generate_session_id() -> str:
     return session_id
 
 
+def _to_xray_trace_id(trace_id: str) -> str | None:
+    """
+    Extract the X-Ray trace ID from a trace header or W3C trace ID.
+
+    Args:
+        trace_id: Trace ID as returned by AgentCore, either an X-Amzn-Trace-Id
+            header value (Root=1-...;Parent=...;Sampled=...), a bare X-Ray trace
+            ID, or a 32-character W3C trace ID
+
+    Returns:
+        Trace ID in X-Ray format (1-xxxxxxxx-xxxxxxxxxxxxxxxxxxxxxxxx), or None
+        if the value is not recognized
+    """
+    for field in trace_id.split(";"):
+        key, _, value = field.strip().partition("=")
+        if key == "Root" and value:
+            trace_id = value
+            break
+
+    trace_id = trace_id.strip()
+    if XRAY_TRACE_ID_PATTERN.match(trace_id):
+        return trace_id
+    if W3C_TRACE_ID_PATTERN.match(trace_id):
+        return f"1-{trace_id[:8]}-{trace_id[8:]}"
+    return None
+
+
+def _wait_for_traces(region: str, trace_ids: list[str]) -> None:
+    """
+    Wait until traces have been ingested by X-Ray.
+
+    Polls BatchGetTraces with increasing delays and returns as soon as every
+    trace is found, capped at roughly TRACE_PROPAGATION_WAIT_SECONDS. This is a
+    best-effort wait: it falls back to a short fixed wait when there are no
+    usable trace IDs or X-Ray can't be queried (missing permissions, throttling,
+    network errors), and never fails the demo.
+
+    Args:
+        region: AWS region
+        trace_ids: Trace IDs returned by the agent invocations
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    pending = {
+        xray_trace_id
+        for trace_id in trace_ids
+        if trace_id and (xray_trace_id := _to_xray_trace_id(trace_id))
+    }
+    if not pending:
+        time.sleep(TRACE_POLL_FALLBACK_WAIT_SECONDS)
+        return
+
+    xray = _get_session(region).client("xray")
+
+    for delay in TRACE_POLL_DELAYS_SECONDS:
+        try:
+            response = xray.batch_get_traces(TraceIds=list(pending))
+        except (ClientError, BotoCoreError) as e:
+            logger.warning(f"Could not query X-Ray ({e}), waiting a fixed time for traces instead")
+            time.sleep(TRACE_POLL_FALLBACK_WAIT_SECONDS)
+            return
+
+        pending -= {trace["Id"] for trace in response.get("Traces", [])}
+        if not pending:
+            return
+        time.sleep(delay)
+
+    logger.warning(f"Traces not yet visible in X-Ray: {', '.join(sorted(pending))}")
+
+
 def _invoke_agent(
     client: boto3.client, agent_arn: str, query: str, session_id: str, enable_trace: bool = True
 ) -> dict[str, Any]:
@@ -161,6 +294,8 @@ def _invoke_agent(
     Raises:
         ClientError: If agent invocation fails
     """
+    from botocore.exceptions import ClientError
+
     logger.info(f"Invoking agent: {agent_arn}")
     logger.info(f"Query: {query}")
     logger.info(f"Session ID: {session_id}")
@@ -175,25 +310,15 @@ def _invoke_agent(
             agentRuntimeArn=agent_arn, runtimeSessionId=session_id, payload=payload
         )
 
-        elapsed_time = time.time() - start_time
-        logger.info(f"Agent response received in {elapsed_time:.2f}s")
+        logger.info(f"Agent started responding in {time.time() - start_time:.2f}s")
 
-        # Parse response - handle StreamingBody
-        agent_response = None
-        if "response" in response:
-            response_body = response["response"]
+        agent_response = read_agent_response(response)
 
-            if hasattr(response_body, "read"):
-                raw_data = response_body.read()
-                if isinstance(raw_data, bytes):
-                    agent_response = raw_data.decode("utf-8")
-                else:
-                    agent_response = str(raw_data)
-            elif isinstance(response_body, str):
-                agent_response = response_body
+        elapsed_time = time.time() - start_time
+        logger.info(f"Agent response received in {elapsed_time:.2f}s")
 
         return {
-            "output": agent_response or "",
+            "output": agent_response,
             "trace_id": response.get("traceId", ""),
             "session_id": session_id,
             "elapsed_time": elapsed_time,
@@ -219,14 +344,20 @@ def _print_result(result: dict[str, Any], scenario_name: str) -> None:
         result: Agent response dictionary
         scenario_name: Name of scenario for context
     """
-    print("\n" + "=" * 80)
-    print(f"SCENARIO: {scenario_name}")
-    print("=" * 80)
-    print(f"\nOutput:\n{result['output']}\n")
-    print(f"Trace ID: {result['trace_id']}")
-    print(f"Session ID: {result['session_id']}")
-    print(f"Elapsed Time: {result['elapsed_time']:.2f}s")
-    print("\n" + "=" * 80 + "\n")
+    print(
+        "\n".join(
+            [
+                "\n" + BANNER,
+                f"SCENARIO: {scenario_name}",
+                BANNER,
+                f"\nOutput:\n{result['output']}\n",
+                f"Trace ID: {result['trace_id']}",
+                f"Session ID: {result['session_id']}",
+                f"Elapsed Time: {result['elapsed_time']:.2f}s",
+                "\n" + BANNER + "\n",
+            ]
+        )
+    )
 
 
 def _print_observability_links(region: str, trace_id: str) -> None:
@@ -237,23 +368,31 @@ def _print_observability_links(region: str, trace_id: str) -> None:
         region: AWS region
         trace_id: Trace ID to look up
     """
-    print("\nView: VIEW TRACES IN:")
-    print("\n1. CloudWatch GenAI Observability (Recommended):")
-    print(f"   https://console.aws.amazon.com/cloudwatch/home?region={region}#cloudwatch-home:")
-    print("   Navigate to GenAI Observability > Bedrock AgentCore")
-    print("   View metrics under Agents, traces under Sessions > Traces")
-    print("   Or use APM > Servers, select agent to monitor")
-
-    print("\n2. Braintrust Dashboard:")
-    print("   https://www.braintrust.dev/app")
-
-    print("\n3. CloudWatch Logs:")
-    print(f"   https://console.aws.amazon.com/cloudwatch/home?region={region}#logsV2:log-groups")
-    print("   Filter by session ID or trace ID\n")
+    print(
+        "\n".join(
+            [
+                "\nView: VIEW TRACES IN:",
+                "\n1. CloudWatch GenAI Observability (Recommended):",
+                f"   https://console.aws.amazon.com/cloudwatch/home?region={region}#cloudwatch-home:",
+                "   Navigate to GenAI Observability > Bedrock AgentCore",
+                "   View metrics under Agents, traces under Sessions > Traces",
+                "   Or use APM > Servers, select agent to monitor",
+                "\n2. Braintrust Dashboard:",
+                "   https://www.braintrust.dev/app",
+                "\n3. CloudWatch Logs:",
+                f"   https://console.aws.amazon.com/cloudwatch/home?region={region}#logsV2:log-groups",
+                "   Filter by session ID or trace ID\n",
+            ]
+        )
+    )
 
 
 def scenario_success(
-    client: boto3.client, agent_arn: str, region: str, braintrust_enabled: bool = False
+    client: boto3.client,
+    agent_arn: str,
+    region: str,
+    braintrust_enabled: bool = False,
+    result: dict[str, Any] | None = None,
 ) -> None:
     """
     Scenario 1: Successful multi-tool query.
@@ -275,38 +414,54 @@ def scenario_success(
         agent_arn: ARN of deployed agent
         region: AWS region
         braintrust_enabled: Whether Braintrust observability is enabled
+        result: Result of an invocation already made for this scenario; the
+            agent is invoked here when not provided
     """
     logger.info("Starting Scenario 1: Successful Multi-Tool Query")
 
-    session_id = _generate_session_id()
-    query = "What's the weather in Seattle and what time is it there?"
-
-    result = _invoke_agent(client=client, agent_arn=agent_arn, query=query, session_id=session_id)
+    if result is None:
+        result = _invoke_agent(
+            client=client,
+            agent_arn=agent_arn,
+            query=SUCCESS_SCENARIO_QUERY,
+            session_id=_generate_session_id(),
+        )
 
     _print_result(result, "Scenario 1: Successful Multi-Tool Query")
     _print_observability_links(region, result["trace_id"])
 
-    print("✓ Expected in CloudWatch GenAI Observability:")
-    print("   - Agent invocation span")
-    print("   - Tool selection span (reasoning)")
-    print("   - Tool execution spans: weather tool, time tool")
-    print("   - Total latency: ~1-2 seconds")
+    messages = [
+        "✓ Expected in CloudWatch GenAI Observability:",
+        "   - Agent invocation span",
+        "   - Tool selection span (reasoning)",
+        "   - Tool execution spans: weather tool, time tool",
+        "   - Total latency: ~1-2 seconds",
+    ]
 
     if braintrust_enabled:
-        print("\n✓ Expected in Braintrust:")
-        print("   - LLM call details (model, tokens, cost)")
-        print("   - Tool execution timeline")
-        print("   - Latency breakdown by component")
-        print("   - View at: https://www.braintrust.dev/app")
+        messages += [
+            "\n✓ Expected in Braintrust:",
+            "   - LLM call details (model, tokens, cost)",
+            "   - Tool execution timeline",
+            "   - Latency breakdown by component",
+            "   - View at: https://www.braintrust.dev/app",
+        ]
     else:
-        print("\n⚠ Braintrust Integration:")
-        print("   - Not configured for this deployment")
-        print("   - To enable: Redeploy with --braintrust-api-key and --braintrust-project-id")
-        print("   - See README.md for setup instructions")
+        messages += [
+            "\n⚠ Braintrust Integration:",
+            "   - Not configured for this deployment",
+            "   - To enable: Redeploy with --braintrust-api-key and --braintrust-project-id",
+            "   - See README.md for setup instructions",
+        ]
+    print("\n".join(messages))
 
 
 def scenario_error(
-    client: boto3.client, agent_arn: str, region: str, braintrust_enabled: bool = False
+    client: boto3.client,
+    agent_arn: str,
+    region: str,
+    braintrust_enabled: bool = False,
+    result: dict[str, Any] | None = None,
 ) -> None:
     """
     Scenario 2: Error handling demonstration.
@@ -328,34 +483,46 @@ def scenario_error(
         agent_arn: ARN of deployed agent
         region: AWS region
         braintrust_enabled: Whether Braintrust observability is enabled
+        result: Result of an invocation already made for this scenario; the
+            agent is invoked here when not provided
     """
     logger.info("Starting Scenario 2: Error Handling")
 
-    session_id = _generate_session_id()
-    query = "Calculate the factorial of -5"
-
-    result = _invoke_agent(client=client, agent_arn=agent_arn, query=query, session_id=session_id)
+    if result is None:
+        result = _invoke_agent(
+            client=client,
+            agent_arn=agent_arn,
+            query=ERROR_SCENARIO_QUERY,
+            session_id=_generate_session_id(),
+        )
 
     _print_result(result, "Scenario 2: Error Handling")
     _print_observability_links(region, result["trace_id"])
 
-    print("✓ Expected in CloudWatch GenAI Observability:")
-    print("   - Error span highlighted in red")
-    print("   - Error status code and message in attributes")
-    print("   - Calculator tool span shows failure")
-    print("   - Agent handles error gracefully")
+    messages = [
+        "✓ Expected in CloudWatch GenAI Observability:",
+        "   - Error span highlighted in red",
+        "   - Error status code and message in attributes",
+        "   - Calculator tool span shows failure",
+        "   - Agent handles error gracefully",
+    ]
 
     if braintrust_enabled:
-        print("\n✓ Expected in Braintrust:")
-        print("   - Error flagged with details")
-        print("   - Failure rate metrics updated")
-        print("   - Error categorization and tracking")
-        print("   - View at: https://www.braintrust.dev/app")
+        messages += [
+            "\n✓ Expected in Braintrust:",
+            "   - Error flagged with details",
+            "   - Failure rate metrics updated",
+            "   - Error categorization and tracking",
+            "   - View at: https://www.braintrust.dev/app",
+        ]
     else:
-        print("\n⚠ Braintrust Integration:")
-        print("   - Not configured for this deployment")
-        print("   - To enable: Redeploy with --braintrust-api-key and --braintrust-project-id")
-        print("   - See README.md for setup instructions")
+        messages += [
+            "\n⚠ Braintrust Integration:",
+            "   - Not configured for this deployment",
+            "   - To enable: Redeploy with --braintrust-api-key and --braintrust-project-id",
+            "   - See README.md for setup instructions",
+        ]
+    print("\n".join(messages))
 
 
 def scenario_dashboard(region: str, braintrust_enabled: bool = False) -> None:
@@ -372,40 +539,44 @@ def scenario_dashboard(region: str, braintrust_enabled: bool = False) -> None:
     """
     logger.info("Starting Scenario 3: Dashboard Walkthrough")
 
-    print("\n" + "=" * 80)
-    print("SCENARIO: Dashboard Walkthrough")
-    print("=" * 80)
-
-    print("\nView: CloudWatch Dashboard:")
-    print(f"   https://console.aws.amazon.com/cloudwatch/home?region={region}#dashboards:")
-    print("\n   Key Metrics to Review:")
-    print("   1. Request Rate (requests/minute)")
-    print("   2. Latency Distribution (P50, P90, P99)")
-    print("   3. Error Rate by Tool")
-    print("   4. Token Consumption over Time")
-    print("   5. Success Rate by Query Type")
+    messages = [
+        "\n" + BANNER,
+        "SCENARIO: Dashboard Walkthrough",
+        BANNER,
+        "\nView: CloudWatch Dashboard:",
+        f"   https://console.aws.amazon.com/cloudwatch/home?region={region}#dashboards:",
+        "\n   Key Metrics to Review:",
+        "   1. Request Rate (requests/minute)",
+        "   2. Latency Distribution (P50, P90, P99)",
+        "   3. Error Rate by Tool",
+        "   4. Token Consumption over Time",
+        "   5. Success Rate by Query Type",
+    ]
 
     if braintrust_enabled:
-        print("\n✓ Braintrust Dashboard:")
-        print("   https://www.braintrust.dev/app")
-        print("\n   Key Metrics to Review:")
-        print("   1. LLM Cost Tracking (per invocation)")
-        print("   2. Model Performance Metrics")
-        print("   3. Quality Scores and Evaluations")
-        print("   4. Prompt/Response Analysis")
-        print("   5. Token Usage Breakdown")
+        messages += [
+            "\n✓ Braintrust Dashboard:",
+            "   https://www.braintrust.dev/app",
+            "\n   Key Metrics to Review:",
+            "   1. LLM Cost Tracking (per invocation)",
+            "   2. Model Performance Metrics",
+            "   3. Quality Scores and Evaluations",
+            "   4. Prompt/Response Analysis",
+            "   5. Token Usage Breakdown",
+        ]
     else:
-        print("\n⚠ Braintrust Dashboard (Not Configured):")
-        print("   https://www.braintrust.dev/app")
-        print("\n   To enable Braintrust observability:")
-        print("   1. Get Braintrust API key from: https://www.braintrust.dev/app/settings/api-keys")
-        print("   2. Get project ID from your Braintrust project URL")
-        print(
-            "   3. Redeploy agent with: scripts/deploy_agent.sh --braintrust-api-key KEY --braintrust-project-id ID"
-        )
-        print("\n   See README.md for detailed setup instructions")
+        messages += [
+            "\n⚠ Braintrust Dashboard (Not Configured):",
+            "   https://www.braintrust.dev/app",
+            "\n   To enable Braintrust observability:",
+            "   1. Get Braintrust API key from: https://www.braintrust.dev/app/settings/api-keys",
+            "   2. Get project ID from your Braintrust project URL",
+            "   3. Redeploy agent with: scripts/deploy_agent.sh --braintrust-api-key KEY --braintrust-project-id ID",
+            "\n   See README.md for detailed setup instructions",
+        ]
 
-    print("\n" + "=" * 80 + "\n")
+    messages.append("\n" + BANNER + "\n")
+    print("\n".join(messages))
 
 
 def main() -> None:
@@ -416,29 +587,12 @@ def main() -> None:
     1. success - Multi-tool query with successful execution
     2. error - Error handling demonstration
     3. dashboard - Dashboard walkthrough
-    4. all - Run all scenarios sequentially
+    4. all - Run all scenarios (success and error invoked concurrently)
     """
     parser = argparse.ArgumentParser(
         description="Amazon Bedrock AgentCore Observability Demo with Dual Platform Support",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-    # Run all scenarios (reads agent ID from .deployment_metadata.json)
-    python simple_observability.py --scenario all
-
-    # Run specific scenario
-    python simple_observability.py --scenario success
-
-    # Override agent ID
-    python simple_observability.py --agent-id abc123 --scenario all
-
-    # With environment variables
-    export AGENTCORE_AGENT_ID=abc123
-    python simple_observability.py
-
-    # Enable debug logging
-    python simple_observability.py --debug
-        """,
+        epilog=DEMO_EPILOG,
     )
 
     parser.add_argument(
@@ -514,36 +668,57 @@ Examples:
     client = _create_bedrock_client(region)
 
     try:
-        if args.scenario in ["success", "all"]:
+        if args.scenario == "all":
+            # Both invocations are I/O-bound round trips to AgentCore, so issue
+            # them together and wait for trace propagation once afterwards
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(
+                        _invoke_agent,
+                        client=client,
+                        agent_arn=agent_arn,
+                        query=query,
+                        session_id=_generate_session_id(),
+                    )
+                    for query in (SUCCESS_SCENARIO_QUERY, ERROR_SCENARIO_QUERY)
+                ]
+                success_result, error_result = (future.result() for future in futures)
+
+            scenario_success(client, agent_arn, region, braintrust_enabled, success_result)
+            scenario_error(client, agent_arn, region, braintrust_enabled, error_result)
+
+            print("\nWaiting: Waiting for traces to propagate...\n")
+            _wait_for_traces(region, [success_result["trace_id"], error_result["trace_id"]])
+
+        elif args.scenario == "success":
             scenario_success(client, agent_arn, region, braintrust_enabled)
 
-            if args.scenario == "all":
-                print("\nWaiting: Waiting 10 seconds for traces to propagate...\n")
-                time.sleep(10)
-
-        if args.scenario in ["error", "all"]:
+        elif args.scenario == "error":
             scenario_error(client, agent_arn, region, braintrust_enabled)
 
-            if args.scenario == "all":
-                print("\nWaiting: Waiting 10 seconds for traces to propagate...\n")
-                time.sleep(10)
-
         if args.scenario in ["dashboard", "all"]:
             scenario_dashboard(region, braintrust_enabled)
 
         logger.info("Demo completed successfully!")
-        print("\n✓ Demo Complete!")
-        print("\nNext Steps:")
-        print("1. Open CloudWatch GenAI Observability or APM to view traces")
+        next_steps = [
+            "\n✓ Demo Complete!",
+            "\nNext Steps:",
+            "1. Open CloudWatch GenAI Observability or APM to view traces",
+        ]
         if braintrust_enabled:
-            print("2. Open Braintrust dashboard at https://www.braintrust.dev/app")
-            print("3. Compare observability data across both platforms")
+            next_steps += [
+                "2. Open Braintrust dashboard at https://www.braintrust.dev/app",
+                "3. Compare observability data across both platforms",
+            ]
         else:
-            print(
+            next_steps.append(
                 "2. To enable Braintrust: Redeploy with --braintrust-api-key and --braintrust-project-id"
             )
-        print("3. Examine span attributes and custom metrics")
-        print("4. Review dashboard panels for aggregated metrics\n")
+        next_steps += [
+            "3. Examine span attributes and custom metrics",
+            "4. Review dashboard panels for aggregated metrics\n",
+        ]
+        print("\n".join(next_steps))
 
     except Exception as e:
         logger.exception(f"Demo failed: {e}")
@@ -4,12 +4,6 @@ import logging
 import math
 from typing import Any
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -99,11 +93,11 @@ def _factorial(
         ValueError: If number is negative or not an integer
     """
     if a < 0:
-        logger.error(f"Factorial of negative number attempted: {a}")
+        logger.error("Factorial of negative number attempted: %s", a)
         raise ValueError("Cannot calculate factorial of a negative number")
 
     if not a.is_integer():
-        logger.error(f"Factorial of non-integer attempted: {a}")
+        logger.error("Factorial of non-integer attempted: %s", a)
         raise ValueError("Factorial requires an integer value")
 
     return math.factorial(int(a))
@@ -129,23 +123,23 @@ def calculator(
         ValueError: If operation is invalid or inputs are invalid
     """
     if not operation or not isinstance(operation, str):
-        logger.error(f"Invalid operation parameter: {operation}")
+        logger.error("Invalid operation parameter: %s", operation)
         raise ValueError("Operation must be a non-empty string")
 
     operation_normalized = operation.strip().lower()
 
     valid_operations = ["add", "subtract", "multiply", "divide", "factorial"]
     if operation_normalized not in valid_operations:
-        logger.error(f"Unknown operation: {operation_normalized}")
+        logger.error("Unknown operation: %s", operation_normalized)
         raise ValueError(
             f"Unknown operation: {operation}. Valid operations are: {', '.join(valid_operations)}"
         )
 
     if not isinstance(a, (int, float)):
-        logger.error(f"Invalid first number: {a}")
+        logger.error("Invalid first number: %s", a)
         raise ValueError("First number must be a numeric value")
 
-    logger.info(f"Performing {operation_normalized} operation with a={a}, b={b}")
+    logger.info("Performing %s operation with a=%s, b=%s", operation_normalized, a, b)
 
     result_value: float
 
@@ -179,6 +173,6 @@ def calculator(
         "result": result_value,
     }
 
-    logger.info(f"Calculation result: {result_value}")
+    logger.info("Calculation result: %s", result_value)
 
     return result
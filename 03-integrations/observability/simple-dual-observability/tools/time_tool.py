@@ -6,12 +6,6 @@ from typing import Any
 
 import pytz
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +27,7 @@ def _validate_timezone(
         tz = pytz.timezone(timezone)
         return tz
     except pytz.exceptions.UnknownTimeZoneError as e:
-        logger.error(f"Unknown timezone: {timezone}")
+        logger.error("Unknown timezone: %s", timezone)
         raise ValueError(
             f"Unknown timezone: {timezone}. "
             f"Please use a valid timezone name like 'America/New_York' or 'Europe/London'"
@@ -56,7 +50,7 @@ def get_time(
         ValueError: If timezone is empty or invalid
     """
     if not timezone or not isinstance(timezone, str):
-        logger.error(f"Invalid timezone parameter: {timezone}")
+        logger.error("Invalid timezone parameter: %s", timezone)
         raise ValueError("Timezone must be a non-empty string")
 
     timezone_normalized = timezone.strip()
@@ -65,7 +59,7 @@ def get_time(
         logger.error("Empty timezone after normalization")
         raise ValueError("Timezone cannot be empty")
 
-    logger.info(f"Getting time for timezone: {timezone_normalized}")
+    logger.info("Getting time for timezone: %s", timezone_normalized)
 
     # Validate and get timezone
     tz = _validate_timezone(timezone_normalized)
@@ -81,6 +75,6 @@ def get_time(
         "iso_format": current_time.isoformat(),
     }
 
-    logger.info(f"Time in {timezone_normalized}: {result['date']} {result['time']}")
+    logger.info("Time in %s: %s %s", timezone_normalized, result["date"], result["time"])
 
     return result
@@ -4,12 +4,6 @@ import logging
 import random
 from typing import Any
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +56,7 @@ def get_weather(
         ValueError: If city name is empty or invalid
     """
     if not city or not isinstance(city, str):
-        logger.error(f"Invalid city parameter: {city}")
+        logger.error("Invalid city parameter: %s", city)
         raise ValueError("City name must be a non-empty string")
 
     city_normalized = city.strip().lower()
@@ -71,15 +65,15 @@ def get_weather(
         logger.error("Empty city name after normalization")
         raise ValueError("City name cannot be empty")
 
-    logger.info(f"Getting weather for city: {city_normalized}")
+    logger.info("Getting weather for city: %s", city_normalized)
 
     # Get weather data from mock data or generate random
     if city_normalized in MOCK_WEATHER_DATA:
         weather_data = MOCK_WEATHER_DATA[city_normalized]
-        logger.debug(f"Found mock weather data for {city_normalized}")
+        logger.debug("Found mock weather data for %s", city_normalized)
     else:
         weather_data = _generate_random_weather()
-        logger.debug(f"Generated random weather data for {city_normalized}")
+        logger.debug("Generated random weather data for %s", city_normalized)
 
     result = {
         "city": city.title(),
@@ -88,6 +82,11 @@ def get_weather(
         "humidity_percent": weather_data["humidity"],
     }
 
-    logger.info(f"Weather for {city.title()}: {result['temperature_f']}°F, {result['conditions']}")
+    logger.info(
+        "Weather for %s: %s°F, %s",
+        city.title(),
+        result["temperature_f"],
+        result["conditions"],
+    )
 
     return result